@@ -1,4 +1,6 @@
+import asyncio
 import time
+from io import BytesIO
 from typing import Union, Annotated
 
 from whisper import tokenizer
@@ -6,11 +8,13 @@ from urllib.parse import quote
 from fastapi import APIRouter, Query, UploadFile, File, HTTPException
 from fastapi.responses import StreamingResponse
 
-from app.core.utils import load_audio
 from app.core.config import settings
-from app.core.faster_whisper_asr import transcribe, language_detection
+from app.core.pipeline import PipelineFull
+from app.core.faster_whisper_asr import pipeline, submit_transcribe, submit_language_detection
 
 LANGUAGE_CODES = sorted(list(tokenizer.LANGUAGES.keys()))
+# Suggested wait, in seconds, for clients rejected because the pipeline is full
+RETRY_AFTER_SECONDS = 5
 
 router = APIRouter()
 
@@ -30,8 +34,14 @@ async def asr(
         output: Union[str, None] = Query(default="txt", enum=["txt", "vtt", "srt", "tsv", "json"])
 ):
     start_time = time.time()
-    result = transcribe(load_audio(audio_file.file, encode), task, language, initial_prompt, vad_filter,
-                        word_timestamps, output)
+    # Read the upload here: a started job cannot be cancelled and may outlive the request's file
+    audio = await audio_file.read()
+    try:
+        future = submit_transcribe(BytesIO(audio), encode, task, language, initial_prompt, vad_filter,
+                                   word_timestamps, output)
+    except PipelineFull as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(RETRY_AFTER_SECONDS)})
+    result = await asyncio.wrap_future(future)
     cost_time = time.time() - start_time
     return StreamingResponse(
         result,
@@ -50,10 +60,20 @@ async def detect_language(
         encode: bool = Query(default=True, description="Encode audio first through FFmpeg")
 ):
     stat_time = time.time()
-    detected_lang_code = language_detection(load_audio(audio_file.file, encode))
+    audio = await audio_file.read()
+    try:
+        future = submit_language_detection(BytesIO(audio), encode)
+    except PipelineFull as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(RETRY_AFTER_SECONDS)})
+    detected_lang_code = await asyncio.wrap_future(future)
     cost_time = time.time() - stat_time
     return {
         "detected_language": tokenizer.LANGUAGES[detected_lang_code],
         "language_code": detected_lang_code,
         "cost_time": f"{cost_time:.2f}s"
     }
+
+
+@router.get("/pipeline-stats")
+async def pipeline_stats():
+    return pipeline.stats()
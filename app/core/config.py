@@ -4,6 +4,8 @@ from pathlib import Path
 from typing import Literal, Optional
 
 from pydantic import (
+    PositiveFloat,
+    PositiveInt,
     computed_field,
 )
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -44,5 +46,20 @@ class Settings(BaseSettings):
     WHISPER_ASR_MODEL: str = "large-v3"
     WHISPER_ASR_MODEL_PATH: str = os.path.join(os.path.expanduser("~"), ".cache", "whisper")
 
+    # Worker pools of the request pipeline: ffmpeg decoding, model inference (including mel feature
+    # extraction and VAD, which run inside the model's transcribe call) and output rendering.
+    # ASR_INFERENCE_WORKERS is also the number of concurrent transcriptions the model accepts.
+    ASR_DECODE_WORKERS: PositiveInt = 2
+    ASR_INFERENCE_WORKERS: PositiveInt = 1
+    ASR_FORMAT_WORKERS: PositiveInt = 1
+    # ASR_PIPELINE_QUEUE_SIZE bounds the requests waiting to be decoded; further ones get a 503.
+    # Decoded waveforms waiting for the model are bounded by ASR_INFERENCE_QUEUE_SIZE, since each
+    # one holds the whole audio as float32 samples (about 230 MB per hour of audio).
+    ASR_PIPELINE_QUEUE_SIZE: PositiveInt = 8
+    ASR_INFERENCE_QUEUE_SIZE: PositiveInt = 1
+    ASR_FORMAT_QUEUE_SIZE: PositiveInt = 8
+    # Seconds of recent activity over which per-stage utilization is reported
+    ASR_PIPELINE_STATS_WINDOW: PositiveFloat = 60.0
+
 
 settings = Settings()  # type: ignore
@@ -1,13 +1,15 @@
 import os
+from concurrent.futures import Future
+from functools import partial
 from io import StringIO
-from threading import Lock
 from typing import Union, BinaryIO
 
 import torch
 import whisper
 from faster_whisper import WhisperModel
 
-from app.core.utils import ResultWriter, WriteTXT, WriteSRT, WriteVTT, WriteTSV, WriteJSON
+from app.core.pipeline import Pipeline
+from app.core.utils import ResultWriter, WriteTXT, WriteSRT, WriteVTT, WriteTSV, WriteJSON, load_audio
 
 from app.core.config import settings
 
@@ -27,10 +29,23 @@ model = WhisperModel(
     model_size_or_path=model_name,
     device=device,
     compute_type=model_quantization,
-    download_root=model_path
+    download_root=model_path,
+    num_workers=settings.ASR_INFERENCE_WORKERS
 )
 
-model_lock = Lock()
+# Decoding, inference and rendering run in separate worker pools, so the next request's audio is
+# decoded with ffmpeg while the current one is in the model. Mel feature extraction and VAD happen
+# inside model.transcribe, so featurization stays on the inference critical path and is part of
+# what ASR_INFERENCE_WORKERS throughput covers. Only the inference workers touch the model, and
+# there are exactly as many of them as the model has workers, so no extra locking is needed.
+pipeline = Pipeline(
+    stages=[
+        ("decode", settings.ASR_DECODE_WORKERS, settings.ASR_PIPELINE_QUEUE_SIZE),
+        ("inference", settings.ASR_INFERENCE_WORKERS, settings.ASR_INFERENCE_QUEUE_SIZE),
+        ("format", settings.ASR_FORMAT_WORKERS, settings.ASR_FORMAT_QUEUE_SIZE),
+    ],
+    stats_window=settings.ASR_PIPELINE_STATS_WINDOW
+)
 
 
 def transcribe(
@@ -40,7 +55,6 @@ def transcribe(
         initial_prompt: Union[str, None],
         vad_filter: Union[bool, None],
         word_timestamps: Union[bool, None],
-        output,
 ):
     options_dict = {"task": task}
     if language:
@@ -51,19 +65,21 @@ def transcribe(
         options_dict["vad_filter"] = True
     if word_timestamps:
         options_dict["word_timestamps"] = True
-    with model_lock:
-        segments = []
-        text = ""
-        segment_generator, info = model.transcribe(audio, beam_size=5, **options_dict)
-        for segment in segment_generator:
-            segments.append(segment)
-            text = text + segment.text
-        result = {
-            "language": options_dict.get("language", info.language),
-            "segments": segments,
-            "text": text
-        }
-
+    # The segment generator is lazy, so it is drained here to keep the decoding in the inference stage
+    segments = []
+    text = ""
+    segment_generator, info = model.transcribe(audio, beam_size=5, **options_dict)
+    for segment in segment_generator:
+        segments.append(segment)
+        text = text + segment.text
+    return {
+        "language": options_dict.get("language", info.language),
+        "segments": segments,
+        "text": text
+    }
+
+
+def render(result: dict, output: Union[str, None]):
     output_file = StringIO()
     write_result(result, output_file, output)
     output_file.seek(0)
@@ -71,16 +87,41 @@ def transcribe(
     return output_file
 
 
-def language_detection(audio):
+def load_audio_window(file: BinaryIO, encode: bool):
     # load audio and pad/trim it to fit 30 seconds
-    audio = whisper.pad_or_trim(audio)
+    return whisper.pad_or_trim(load_audio(file, encode))
+
+
+def language_detection(audio):
+    segments, info = model.transcribe(audio, beam_size=5)
+    return info.language
 
-    # detect the spoken language
-    with model_lock:
-        segments, info = model.transcribe(audio, beam_size=5)
-        detected_lang_code = info.language
 
-    return detected_lang_code
+def submit_transcribe(
+        file: BinaryIO,
+        encode: bool,
+        task: Union[str, None],
+        language: Union[str, None],
+        initial_prompt: Union[str, None],
+        vad_filter: Union[bool, None],
+        word_timestamps: Union[bool, None],
+        output: Union[str, None],
+) -> Future:
+    return pipeline.submit(
+        file,
+        partial(load_audio, encode=encode),
+        partial(transcribe, task=task, language=language, initial_prompt=initial_prompt,
+                vad_filter=vad_filter, word_timestamps=word_timestamps),
+        partial(render, output=output),
+    )
+
+
+def submit_language_detection(file: BinaryIO, encode: bool) -> Future:
+    return pipeline.submit(
+        file,
+        partial(load_audio_window, encode=encode),
+        language_detection,
+    )
 
 
 def write_result(
@@ -0,0 +1,176 @@
+import queue
+import time
+from collections import deque
+from concurrent.futures import Future
+from threading import Lock, Thread, get_ident
+from typing import Callable, List, Optional
+
+
+class PipelineFull(RuntimeError):
+    pass
+
+
+class Job:
+    """
+    A unit of work travelling through the pipeline.
+
+    `steps` holds one callable per stage; each receives the value returned by the previous step.
+    A job with fewer steps than the pipeline has stages completes after its last step.
+    """
+
+    def __init__(self, value, steps: List[Callable]):
+        self.value = value
+        self.steps = steps
+        self.future: Future = Future()
+
+
+class Stage:
+    """
+    A bounded queue drained by a fixed pool of worker threads.
+
+    Jobs are handed to the downstream stage with a blocking put, so a slow stage applies
+    backpressure to the ones before it instead of buffering without limit.
+
+    Utilization is the share of worker time spent running steps over the last `stats_window` seconds.
+    """
+
+    def __init__(self, name: str, index: int, workers: int, queue_size: int, stats_window: float = 60.0):
+        # A stage without workers never resolves its jobs, and a zero-sized queue.Queue is unbounded
+        if workers < 1:
+            raise ValueError(f"The {name} stage needs at least one worker, got {workers}")
+        if queue_size < 1:
+            raise ValueError(f"The {name} queue size must be at least 1, got {queue_size}")
+        if stats_window <= 0:
+            raise ValueError(f"The stats window must be positive, got {stats_window}")
+        self.name = name
+        self.index = index
+        self.workers = workers
+        self.queue_size = queue_size
+        self.stats_window = stats_window
+        self.downstream: Optional["Stage"] = None
+
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._stats_lock = Lock()
+        self._started = time.monotonic()
+        self._busy_seconds = 0.0
+        # (start, end) of steps finished within the stats window, and start of steps still running
+        self._busy_intervals = deque()
+        self._running = {}
+        self._in_flight = 0
+        self._blocked = 0
+        self._completed = 0
+        self._failed = 0
+
+        for i in range(workers):
+            Thread(target=self._run, name=f"{name}-{i}", daemon=True).start()
+
+    def put(self, job: Job, block: bool = True):
+        try:
+            self._queue.put(job, block=block)
+        except queue.Full:
+            raise PipelineFull(f"The {self.name} queue is full ({self.queue_size} jobs)") from None
+
+    def _run(self):
+        while True:
+            job = self._queue.get()
+            # Jobs cancelled while still waiting for the first stage are dropped
+            if self.index == 0 and not job.future.set_running_or_notify_cancel():
+                continue
+            start_time = time.monotonic()
+            with self._stats_lock:
+                self._in_flight += 1
+                self._running[get_ident()] = start_time
+            try:
+                job.value = job.steps[self.index](job.value)
+            except BaseException as e:
+                error = e
+            else:
+                error = None
+            end_time = time.monotonic()
+            with self._stats_lock:
+                self._in_flight -= 1
+                del self._running[get_ident()]
+                self._busy_seconds += end_time - start_time
+                self._busy_intervals.append((start_time, end_time))
+                self._prune(end_time)
+                if error is None:
+                    self._completed += 1
+                else:
+                    self._failed += 1
+
+            if error is not None:
+                job.future.set_exception(error)
+            elif self.downstream is not None and self.index + 1 < len(job.steps):
+                # Count jobs waiting for room downstream, otherwise backpressure would hide them
+                with self._stats_lock:
+                    self._blocked += 1
+                try:
+                    self.downstream.put(job)
+                finally:
+                    with self._stats_lock:
+                        self._blocked -= 1
+            else:
+                job.future.set_result(job.value)
+
+    def _prune(self, now: float):
+        while self._busy_intervals and self._busy_intervals[0][1] <= now - self.stats_window:
+            self._busy_intervals.popleft()
+
+    def _windowed_utilization(self, now: float) -> float:
+        window_start = max(now - self.stats_window, self._started)
+        if now <= window_start:
+            return 0.0
+        self._prune(now)
+        busy = sum(end - max(start, window_start) for start, end in self._busy_intervals)
+        busy += sum(now - max(start, window_start) for start in self._running.values())
+        return busy / (self.workers * (now - window_start))
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            now = time.monotonic()
+            return {
+                "workers": self.workers,
+                "queue_size": self.queue_size,
+                "queued": self._queue.qsize(),
+                "in_flight": self._in_flight,
+                "blocked": self._blocked,
+                "completed": self._completed,
+                "failed": self._failed,
+                "busy_seconds": round(self._busy_seconds, 3),
+                "timestamp": round(now, 3),
+                "utilization": round(self._windowed_utilization(now), 4),
+                "utilization_window_seconds": self.stats_window,
+            }
+
+
+class Pipeline:
+    """
+    A chain of stages, each with its own worker pool, so that consecutive requests overlap:
+    while one job occupies a later stage, the next one is already being processed by an earlier one.
+
+    `stages` is a list of (name, workers, queue_size) tuples. The first queue is the admission limit;
+    later ones bound how far an earlier stage may run ahead of the next, and with it how many
+    intermediate values are held in memory.
+    """
+
+    def __init__(self, stages: List[tuple], stats_window: float = 60.0):
+        self.stages = [
+            Stage(name, index, workers, queue_size, stats_window)
+            for index, (name, workers, queue_size) in enumerate(stages)
+        ]
+        for upstream, downstream in zip(self.stages, self.stages[1:]):
+            upstream.downstream = downstream
+
+    def submit(self, value, *steps: Callable) -> Future:
+        """
+        Queue `value` for processing by `steps`, one per stage in order.
+        Raises PipelineFull instead of blocking when the first stage cannot accept more work.
+        """
+        if not 0 < len(steps) <= len(self.stages):
+            raise ValueError(f"Expected between 1 and {len(self.stages)} steps, got {len(steps)}")
+        job = Job(value, list(steps))
+        self.stages[0].put(job, block=False)
+        return job.future
+
+    def stats(self) -> dict:
+        return {stage.name: stage.stats() for stage in self.stages}
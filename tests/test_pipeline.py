@@ -0,0 +1,183 @@
+import threading
+import time
+
+import pytest
+
+from app.core.pipeline import Pipeline, PipelineFull
+
+TIMEOUT = 5
+
+
+def identity(value):
+    return value
+
+
+def blocking_step(release: threading.Event, started: threading.Event = None):
+    def step(value):
+        if started is not None:
+            started.set()
+        release.wait(TIMEOUT)
+        return value
+
+    return step
+
+
+def test_result_comes_back_through_future():
+    pipeline = Pipeline([("decode", 2, 4), ("inference", 1, 4), ("format", 1, 4)])
+
+    future = pipeline.submit(2, lambda x: x + 1, lambda x: x * 10, str)
+
+    assert future.result(TIMEOUT) == "30"
+    stats = pipeline.stats()
+    assert [stage["completed"] for stage in stats.values()] == [1, 1, 1]
+
+
+def test_exception_in_middle_stage_fails_future():
+    pipeline = Pipeline([("decode", 1, 4), ("inference", 1, 4), ("format", 1, 4)])
+    formatted = []
+
+    def fail(value):
+        raise ValueError("bad audio")
+
+    future = pipeline.submit(1, identity, fail, formatted.append)
+
+    with pytest.raises(ValueError, match="bad audio"):
+        future.result(TIMEOUT)
+    assert formatted == []
+    stats = pipeline.stats()
+    assert stats["decode"]["completed"] == 1
+    assert stats["inference"]["completed"] == 0
+    assert stats["inference"]["failed"] == 1
+    assert stats["inference"]["in_flight"] == 0
+    assert stats["format"]["completed"] == 0
+
+
+@pytest.mark.parametrize("stage", [("decode", 0, 1), ("decode", 1, 0)])
+def test_stage_rejects_empty_pool_or_unbounded_queue(stage):
+    with pytest.raises(ValueError):
+        Pipeline([stage])
+
+
+def test_submit_raises_when_first_stage_is_full():
+    pipeline = Pipeline([("decode", 1, 1)])
+    release, started = threading.Event(), threading.Event()
+
+    running = pipeline.submit(0, blocking_step(release, started))
+    assert started.wait(TIMEOUT)
+    queued = pipeline.submit(1, identity)
+    with pytest.raises(PipelineFull):
+        pipeline.submit(2, identity)
+
+    release.set()
+    assert running.result(TIMEOUT) == 0
+    assert queued.result(TIMEOUT) == 1
+
+
+def test_job_with_fewer_steps_skips_later_stages():
+    pipeline = Pipeline([("decode", 1, 4), ("inference", 1, 4), ("format", 1, 4)])
+
+    future = pipeline.submit("en", identity, identity)
+
+    assert future.result(TIMEOUT) == "en"
+    stats = pipeline.stats()
+    assert stats["inference"]["completed"] == 1
+    assert stats["format"]["completed"] == 0
+
+
+def test_job_cancelled_while_queued_is_never_run():
+    pipeline = Pipeline([("decode", 1, 4)])
+    release, started = threading.Event(), threading.Event()
+    ran = []
+
+    running = pipeline.submit(0, blocking_step(release, started))
+    assert started.wait(TIMEOUT)
+    cancelled = pipeline.submit(1, ran.append)
+    assert cancelled.cancel()
+
+    release.set()
+    assert running.result(TIMEOUT) == 0
+    assert pipeline.submit(2, identity).result(TIMEOUT) == 2
+    assert ran == []
+    assert pipeline.stats()["decode"]["completed"] == 2
+
+
+def wait_for(condition):
+    for _ in range(500):
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_job_blocked_on_full_downstream_queue_is_counted():
+    pipeline = Pipeline([("decode", 1, 1), ("inference", 1, 1)])
+    release, started = threading.Event(), threading.Event()
+
+    futures = [pipeline.submit(0, identity, blocking_step(release, started))]
+    assert started.wait(TIMEOUT)
+    futures.append(pipeline.submit(1, identity, identity))
+    assert wait_for(lambda: pipeline.stats()["inference"]["queued"] == 1)
+    futures.append(pipeline.submit(2, identity, identity))
+    assert wait_for(lambda: pipeline.stats()["decode"]["blocked"] == 1)
+    assert pipeline.stats()["decode"]["in_flight"] == 0
+
+    release.set()
+    assert [future.result(TIMEOUT) for future in futures] == [0, 1, 2]
+    assert pipeline.stats()["decode"]["blocked"] == 0
+
+
+def test_next_job_is_decoded_while_current_one_is_in_inference():
+    pipeline = Pipeline([("decode", 1, 4), ("inference", 1, 1), ("format", 1, 4)])
+    release, started = threading.Event(), threading.Event()
+    decoded = []
+
+    def decode(value):
+        decoded.append(value)
+        return value
+
+    first = pipeline.submit(0, decode, blocking_step(release, started), identity)
+    assert started.wait(TIMEOUT)
+    second = pipeline.submit(1, decode, blocking_step(release), identity)
+
+    assert wait_for(lambda: pipeline.stats()["inference"]["queued"] == 1)
+    assert decoded == [0, 1]
+    stats = pipeline.stats()
+    assert stats["decode"]["completed"] == 2
+    assert stats["inference"]["in_flight"] == 1
+
+    release.set()
+    assert first.result(TIMEOUT) == 0
+    assert second.result(TIMEOUT) == 1
+
+
+def test_utilization_covers_only_the_stats_window():
+    pipeline = Pipeline([("inference", 1, 1)], stats_window=0.3)
+    release = threading.Event()
+
+    # A step running longer than the window keeps the stage fully busy, not more
+    future = pipeline.submit(0, blocking_step(release))
+    time.sleep(0.5)
+    assert pipeline.stats()["inference"]["utilization"] == pytest.approx(1.0, abs=0.05)
+
+    release.set()
+    future.result(TIMEOUT)
+    time.sleep(0.4)
+    stats = pipeline.stats()["inference"]
+    assert stats["utilization"] == 0.0
+    assert stats["busy_seconds"] == pytest.approx(0.5, abs=0.1)
+
+
+def test_utilization_is_shared_across_workers():
+    pipeline = Pipeline([("inference", 2, 1)], stats_window=0.5)
+    release = threading.Event()
+    time.sleep(0.6)
+
+    # One of two workers busy for half of the window
+    future = pipeline.submit(0, blocking_step(release))
+    time.sleep(0.25)
+    release.set()
+    future.result(TIMEOUT)
+    assert pipeline.stats()["inference"]["utilization"] == pytest.approx(0.25, abs=0.08)
+
+    time.sleep(0.6)
+    assert pipeline.stats()["inference"]["utilization"] == 0.0